@@ -1,30 +1,52 @@
 """FastAPI routes"""
 
 import logging
-from typing import Optional
+import re
+from typing import Optional, TYPE_CHECKING
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+
+if TYPE_CHECKING:
+    from ..orchestrator import EventOrchestrator
+    from ..services.error_logger import ErrorLogger
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Global orchestrator reference (set by main.py)
-orchestrator: Optional["EventOrchestrator"] = None
+# Allow-list for device serial numbers in path parameters (e.g. T8600P1234567890)
+_DEVICE_SN_RE = re.compile(r"[A-Za-z0-9_\-]{1,64}")
+
+
+def get_optional_orchestrator(request: Request) -> Optional["EventOrchestrator"]:
+    """Get orchestrator from app state (None until startup completes)"""
+    return getattr(request.app.state, "orchestrator", None)
+
+
+def get_orchestrator(
+    orchestrator: Optional["EventOrchestrator"] = Depends(get_optional_orchestrator),
+) -> "EventOrchestrator":
+    """Get orchestrator from app state, or fail with 503 if not ready"""
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Service not ready")
+    return orchestrator
 
 
-def set_orchestrator(orch: "EventOrchestrator") -> None:
-    """Set global orchestrator reference"""
-    global orchestrator
-    orchestrator = orch
+def get_error_logger(
+    orchestrator: "EventOrchestrator" = Depends(get_orchestrator),
+) -> "ErrorLogger":
+    """Get error logger from orchestrator"""
+    return orchestrator.error_logger
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(
+    orchestrator: Optional["EventOrchestrator"] = Depends(get_optional_orchestrator),
+):
     """Health check endpoint"""
     if not orchestrator:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "initializing", "version": "2.0.0"}
         )
@@ -39,7 +61,10 @@ async def health_check():
 
 
 @router.get("/errors")
-async def get_recent_errors(limit: int = Query(10, le=50)):
+async def get_recent_errors(
+    limit: int = Query(10, le=50),
+    error_logger: "ErrorLogger" = Depends(get_error_logger),
+):
     """
     Get recent error logs (for debugging)
 
@@ -49,10 +74,7 @@ async def get_recent_errors(limit: int = Query(10, le=50)):
     Returns:
         List of recent errors
     """
-    if not orchestrator:
-        raise HTTPException(status_code=503, detail="Service not ready")
-
-    errors = orchestrator.error_logger.get_recent_errors(limit=limit)
+    errors = error_logger.get_recent_errors(limit=limit)
 
     return {
         "count": len(errors),
@@ -61,7 +83,10 @@ async def get_recent_errors(limit: int = Query(10, le=50)):
 
 
 @router.get("/device/{device_sn}/commands")
-async def get_device_commands(device_sn: str):
+async def get_device_commands(
+    device_sn: str,
+    orchestrator: "EventOrchestrator" = Depends(get_orchestrator),
+):
     """
     Get supported commands for a device
 
@@ -71,8 +96,8 @@ async def get_device_commands(device_sn: str):
     Returns:
         List of supported commands
     """
-    if not orchestrator:
-        raise HTTPException(status_code=503, detail="Service not ready")
+    if not _DEVICE_SN_RE.fullmatch(device_sn):
+        raise HTTPException(status_code=400, detail="Invalid device serial number")
 
     try:
         response = await orchestrator.websocket_client.send_command(
@@ -1,10 +1,11 @@
 """WebSocket client for eufy-security-ws"""
 
 import asyncio
-import json
+import itertools
 import logging
-import uuid
-from typing import Callable, Optional, Dict, Any
+import random
+from typing import Callable, Optional, Any
+import orjson
 import websockets
 from websockets.client import WebSocketClientProtocol
 
@@ -12,6 +13,8 @@ from ..utils.retry import retry_async
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the reconnect backoff exponent (2 ** 30 is far past any sane max delay)
+MAX_BACKOFF_EXPONENT = 30
 
 
 class WebSocketClient:
@@ -25,40 +28,58 @@ class WebSocketClient:
         self,
         url: str,
         reconnect_delay: float = 5.0,
+        max_reconnect_delay: float = 60.0,
         heartbeat_interval: float = 30.0,
+        max_concurrent_handlers: int = 64,
+        handler_drain_timeout: float = 10.0,
     ):
         """
         Initialize WebSocket client
 
         Args:
             url: WebSocket URL (e.g., ws://127.0.0.1:3000/ws)
-            reconnect_delay: Delay between reconnection attempts (seconds)
+            reconnect_delay: Initial delay between reconnection attempts (seconds)
+            max_reconnect_delay: Upper bound for the backed-off reconnect delay (seconds)
             heartbeat_interval: Interval for sending ping frames (seconds)
+            max_concurrent_handlers: Max coroutine event handlers running at once
+            handler_drain_timeout: How long disconnect() waits for in-flight handlers
+                                   before cancelling them (seconds)
         """
         self.url = url
         self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._reconnect_attempts = 0
         self.heartbeat_interval = heartbeat_interval
 
         self.ws: Optional[WebSocketClientProtocol] = None
-        self.event_handlers: Dict[str, Callable] = {}
+        self.event_handlers: dict[str, Callable] = {}
+        # event_type -> (handler, is_coroutine), resolved once in on()
+        self._dispatch: dict[str, tuple[Callable, bool]] = {}
         self._running = False
-        self._reconnect_task: Optional[asyncio.Task] = None
 
         # Request-response correlation: messageId -> asyncio.Future
-        self._pending_requests: Dict[str, asyncio.Future] = {}
+        self._pending_requests: dict[str, asyncio.Future] = {}
+        self._message_ids = itertools.count(1)
+
+        # Coroutine handlers run as tasks so a slow webhook doesn't stall the reader.
+        # The reader takes a semaphore slot before spawning one, so it blocks (and
+        # applies backpressure) once max_concurrent_handlers are in flight
+        self._handler_semaphore = asyncio.Semaphore(max_concurrent_handlers)
+        self._handler_tasks: set[asyncio.Task] = set()
+        self.handler_drain_timeout = handler_drain_timeout
 
     async def connect(self) -> None:
         """Connect to WebSocket server with 3x retry"""
         try:
             await self._connect_with_retry()
         except Exception as e:
-            logger.error(f"Failed to connect after retries: {e}")
+            logger.error("Failed to connect after retries: %s", e)
             raise
 
     @retry_async(max_attempts=3, delay=2.0, backoff=2.0)
     async def _connect_with_retry(self) -> None:
         """Internal connection method with retry"""
-        logger.info(f"Connecting to eufy-security-ws at {self.url}")
+        logger.info("Connecting to eufy-security-ws at %s", self.url)
         self.ws = await websockets.connect(
             self.url,
             ping_interval=self.heartbeat_interval,
@@ -67,24 +88,19 @@ class WebSocketClient:
         logger.info("✅ WebSocket connected to eufy-security-ws")
 
         # Send start_listening command to begin receiving events
-        message_id = str(uuid.uuid4())
+        message_id = self._next_message_id()
         start_command = {
             "messageId": message_id,
             "command": "start_listening"
         }
-        await self.ws.send(json.dumps(start_command))
+        await self.ws.send(orjson.dumps(start_command).decode())
         logger.info("📡 Sent start_listening command to eufy-security-ws")
 
     async def disconnect(self) -> None:
         """Disconnect from WebSocket server"""
         self._running = False
 
-        if self._reconnect_task:
-            self._reconnect_task.cancel()
-            try:
-                await self._reconnect_task
-            except asyncio.CancelledError:
-                pass
+        await self._wait_for_handlers()
 
         if self.ws:
             await self.ws.close()
@@ -92,8 +108,8 @@ class WebSocketClient:
             logger.info("WebSocket disconnected")
 
     async def send_command(
-        self, command: str, params: Optional[Dict[str, Any]] = None, wait_response: bool = False, timeout: float = 10.0
-    ) -> Optional[Dict[str, Any]]:
+        self, command: str, params: Optional[dict[str, Any]] = None, wait_response: bool = False, timeout: float = 10.0
+    ) -> Optional[dict[str, Any]]:
         """
         Send command to eufy-security-ws with 3x retry
 
@@ -112,44 +128,49 @@ class WebSocketClient:
         if wait_response:
             return await self._send_command_with_response(command, params or {}, timeout)
         else:
-            await self._send_command_with_retry(command, params or {})
+            # Encode once up front so retries resend the same payload
+            payload = orjson.dumps({"command": command, **(params or {})}).decode()
+            await self._send_command_with_retry(command, payload)
             return None
 
     async def _send_command_with_response(
-        self, command: str, params: Dict[str, Any], timeout: float
-    ) -> Optional[Dict[str, Any]]:
+        self, command: str, params: dict[str, Any], timeout: float
+    ) -> Optional[dict[str, Any]]:
         """Send command and wait for response"""
-        message_id = str(uuid.uuid4())
+        message_id = self._next_message_id()
         message = {"messageId": message_id, "command": command, **params}
 
-        # Create a Future to wait for the response
-        future = asyncio.get_event_loop().create_future()
+        # Create a Future to wait for the response; it removes its own pending
+        # entry once resolved, cancelled or timed out
+        future = asyncio.get_running_loop().create_future()
         self._pending_requests[message_id] = future
+        future.add_done_callback(lambda _: self._pending_requests.pop(message_id, None))
 
         try:
             # Send the command
-            await self.ws.send(json.dumps(message))
-            logger.debug(f"Sent command with response: {command} (messageId: {message_id})")
-
-            # Wait for the response with timeout
-            response = await asyncio.wait_for(future, timeout=timeout)
-            return response
+            await self.ws.send(orjson.dumps(message).decode())
+        except BaseException:
+            future.cancel()
+            raise
+        logger.debug("Sent command with response: %s (messageId: %s)", command, message_id)
 
+        try:
+            # Wait for the response with timeout (wait_for cancels the future on timeout)
+            return await asyncio.wait_for(future, timeout=timeout)
         except asyncio.TimeoutError:
-            logger.warning(f"Timeout waiting for response to command: {command}")
+            logger.warning("Timeout waiting for response to command: %s", command)
             return None
-        finally:
-            # Clean up the pending request
-            self._pending_requests.pop(message_id, None)
 
     @retry_async(max_attempts=3, delay=1.0, backoff=2.0)
-    async def _send_command_with_retry(
-        self, command: str, params: Dict[str, Any]
-    ) -> None:
+    async def _send_command_with_retry(self, command: str, payload: str) -> None:
         """Internal send command method with retry"""
-        message = {"command": command, **params}
-        await self.ws.send(json.dumps(message))
-        logger.debug(f"Sent command: {command}")
+        await self.ws.send(payload)
+        logger.debug("Sent command: %s", command)
+
+    def _next_message_id(self) -> str:
+        """Return a messageId unique for the lifetime of this client"""
+        # The server echoes messageId back as-is, so a counter is enough
+        return str(next(self._message_ids))
 
     def on(self, event_type: str, handler: Callable) -> None:
         """
@@ -160,7 +181,8 @@ class WebSocketClient:
             handler: Async function to handle event
         """
         self.event_handlers[event_type] = handler
-        logger.debug(f"Registered handler for event: {event_type}")
+        self._dispatch[event_type] = (handler, asyncio.iscoroutinefunction(handler))
+        logger.debug("Registered handler for event: %s", event_type)
 
     async def start_listening(self) -> None:
         """Start listening for WebSocket events"""
@@ -176,71 +198,104 @@ class WebSocketClient:
                 logger.info("📡 Listening for WebSocket messages...")
                 async for message in self.ws:
                     try:
-                        event = json.loads(message)
+                        event = orjson.loads(message)
                         await self._handle_event(event)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse WebSocket message: {e}")
+                    except orjson.JSONDecodeError as e:
+                        logger.error("Failed to parse WebSocket message: %s", e)
                     except Exception as e:
-                        logger.error(f"Error handling event: {e}", exc_info=True)
+                        logger.error("Error handling event: %s", e, exc_info=True)
 
             except websockets.exceptions.ConnectionClosed:
                 logger.warning("WebSocket connection closed")
                 if self._running:
                     await self._reconnect()
             except Exception as e:
-                logger.error(f"WebSocket error: {e}", exc_info=True)
+                logger.error("WebSocket error: %s", e, exc_info=True)
                 if self._running:
                     await self._reconnect()
 
     async def _handle_event(self, event: dict) -> None:
         """Handle incoming WebSocket event or response"""
-        # Log ALL raw messages to debug event reception
-        msg_type = event.get("type", "unknown")
-        logger.debug(f"📨 Raw WebSocket message: type={msg_type}")
+        msg_type = event.get("type")
+        logger.debug("📨 Raw WebSocket message: type=%s", msg_type or "unknown")
 
         # Handle command responses (type: "result")
-        if event.get("type") == "result":
+        if msg_type == "result":
             message_id = event.get("messageId")
-            if message_id and message_id in self._pending_requests:
+            future = self._pending_requests.get(message_id) if message_id else None
+            if future is not None:
                 # Resolve the pending request with the response
-                future = self._pending_requests[message_id]
                 if not future.done():
                     future.set_result(event)
-                logger.debug(f"✅ Resolved response for messageId: {message_id}")
+                logger.debug("✅ Resolved response for messageId: %s", message_id)
             else:
-                logger.debug(f"Received result without pending request: {event}")
+                logger.debug("Received result without pending request: %s", event)
             return
 
         # Handle nested event structure from eufy-security-ws
         # Expected format: {"type": "event", "event": {"event": "motion detected", ...}}
-        if event.get("type") == "event" and isinstance(event.get("event"), dict):
-            inner_event = event["event"]
+        inner_event = event.get("event")
+        if msg_type == "event" and isinstance(inner_event, dict):
             event_type = inner_event.get("event")
             # Use the inner event dict for handlers (contains serialNumber, state, etc.)
             event_data = inner_event
         else:
             # Fallback to flat structure for backward compatibility
-            event_type = event.get("event")
+            event_type = inner_event
             event_data = event
 
         if not event_type:
-            logger.debug(f"Received event without type: {event}")
+            logger.debug("Received event without type: %s", event)
             return
 
-        handler = self.event_handlers.get(event_type)
-        if handler:
+        entry = self._dispatch.get(event_type)
+        if entry:
+            handler, is_coroutine = entry
+            if is_coroutine:
+                await self._handler_semaphore.acquire()
+                task = asyncio.create_task(self._run_handler(event_type, handler, event_data))
+                self._handler_tasks.add(task)
+                task.add_done_callback(self._on_handler_done)
+                return
+
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event_data)
-                else:
-                    handler(event_data)
+                handler(event_data)
             except Exception as e:
                 logger.error(
-                    f"Error in event handler for {event_type}: {e}", exc_info=True
+                    "Error in event handler for %s: %s", event_type, e, exc_info=True
                 )
         else:
             # Only log unhandled events at debug level to reduce noise
-            logger.debug(f"No handler registered for event: {event_type}")
+            logger.debug("No handler registered for event: %s", event_type)
+
+    async def _run_handler(self, event_type: str, handler: Callable, event_data: dict) -> None:
+        """Run a coroutine event handler, logging any error"""
+        try:
+            await handler(event_data)
+        except Exception as e:
+            logger.error(
+                "Error in event handler for %s: %s", event_type, e, exc_info=True
+            )
+
+    def _on_handler_done(self, task: asyncio.Task) -> None:
+        """Release the handler's semaphore slot (runs even if cancelled before starting)"""
+        self._handler_tasks.discard(task)
+        self._handler_semaphore.release()
+
+    async def _wait_for_handlers(self) -> None:
+        """Wait for in-flight event handler tasks, cancelling any still running after the timeout"""
+        if not self._handler_tasks:
+            return
+
+        # Bounded so a handler stuck in webhook retries can't hold up shutdown
+        _, pending = await asyncio.wait(
+            set(self._handler_tasks), timeout=self.handler_drain_timeout
+        )
+        if pending:
+            logger.warning("Cancelling %d event handlers still running at shutdown", len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def _reconnect(self) -> None:
         """Reconnect to WebSocket server"""
@@ -251,10 +306,20 @@ class WebSocketClient:
                 pass
             self.ws = None
 
-        logger.info(f"Reconnecting in {self.reconnect_delay}s...")
-        await asyncio.sleep(self.reconnect_delay)
+        # Exponential backoff with up to 10% jitter; reset once a connection succeeds.
+        # Attempts stop counting at the cap so 2 ** n can't overflow in long outages
+        delay = self.reconnect_delay * 2 ** min(self._reconnect_attempts, MAX_BACKOFF_EXPONENT)
+        if delay >= self.max_reconnect_delay:
+            delay = self.max_reconnect_delay
+        else:
+            self._reconnect_attempts += 1
+        delay += random.uniform(0, delay * 0.1)
+
+        logger.info("Reconnecting in %.1fs...", delay)
+        await asyncio.sleep(delay)
 
         try:
             await self.connect()
+            self._reconnect_attempts = 0
         except Exception as e:
-            logger.error(f"Reconnection failed: {e}")
\ No newline at end of file
+            logger.error("Reconnection failed: %s", e)
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Shared base for camera event handlers"""
+
+import logging
+from typing import Callable, Optional
+
+from ..models.events import BaseEvent
+from ..services.workato_client import WorkatoWebhook
+from ..services.error_logger import ErrorLogger
+from ..services.camera_registry import CameraRegistry, CameraInfo
+
+logger = logging.getLogger(__name__)
+
+
+class BaseEventHandler:
+    """
+    Base class for handlers of per-camera WebSocket events
+
+    Holds the shared collaborators and resolves which registered camera an
+    event refers to. Subclasses set event_label for log messages.
+    """
+
+    __slots__ = ("camera_registry", "workato_webhook", "error_logger")
+
+    event_label = "Event"
+
+    def __init__(
+        self,
+        camera_registry: CameraRegistry,
+        workato_webhook: WorkatoWebhook,
+        error_logger: ErrorLogger,
+    ):
+        """
+        Initialize event handler
+
+        Args:
+            camera_registry: CameraRegistry instance
+            workato_webhook: WorkatoWebhook instance
+            error_logger: ErrorLogger instance
+        """
+        self.camera_registry = camera_registry
+        self.workato_webhook = workato_webhook
+        self.error_logger = error_logger
+
+    async def _resolve_camera(self, event: dict) -> Optional[tuple[str, CameraInfo]]:
+        """
+        Resolve the registered camera an event refers to
+
+        Args:
+            event: Event dict from WebSocket
+
+        Returns:
+            (device_sn, camera) tuple, or None if the event has no serial
+            number or the camera is not in the registry
+        """
+        device_sn = event.get("serialNumber")
+
+        if not device_sn:
+            logger.error("%s event missing serialNumber: %s", self.event_label, event)
+            return None
+
+        camera = await self.camera_registry.get_camera(device_sn)
+        if not camera:
+            logger.warning("%s event from unknown camera: %s", self.event_label, device_sn)
+            return None
+
+        return device_sn, camera
+
+    async def _send_webhook(
+        self,
+        device_sn: str,
+        build_event: Callable[[], BaseEvent],
+        operation: str,
+        context: dict,
+        retry_count: int,
+    ) -> bool:
+        """
+        Build and send an event webhook, reporting failures to the ErrorLogger
+
+        The event model is built here so validation errors are reported like
+        send failures instead of escaping to the caller.
+
+        Args:
+            device_sn: Device serial number (for logging)
+            build_event: Zero-argument callable returning the event model
+            operation: Operation name for the error log
+            context: Error log context
+            retry_count: Retry count to record on failure
+
+        Returns:
+            True if the webhook was sent
+        """
+        try:
+            await self.workato_webhook.send_event(build_event())
+            return True
+        except Exception as e:
+            logger.error(
+                "Failed to send %s webhook for %s: %s", self.event_label.lower(), device_sn, e
+            )
+            await self.error_logger.log_failed_retry(
+                operation=operation,
+                error=e,
+                context=context,
+                retry_count=retry_count,
+            )
+            return False
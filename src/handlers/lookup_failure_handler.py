@@ -1,17 +1,16 @@
 """Lookup failure handler for offline camera detection"""
 
 import logging
+from functools import partial
 from typing import Optional
 
 from ..models.events import CameraOfflineEvent
-from ..services.workato_client import WorkatoWebhook
-from ..services.error_logger import ErrorLogger
-from ..services.camera_registry import CameraRegistry
+from .base import BaseEventHandler
 
 logger = logging.getLogger(__name__)
 
 
-class LookupFailureHandler:
+class LookupFailureHandler(BaseEventHandler):
     """
     Handles lookup failure events from standalone cameras
 
@@ -19,23 +18,9 @@ class LookupFailureHandler:
     and times out, this handler sends an offline notification webhook.
     """
 
-    def __init__(
-        self,
-        camera_registry: CameraRegistry,
-        workato_webhook: WorkatoWebhook,
-        error_logger: ErrorLogger,
-    ):
-        """
-        Initialize lookup failure handler
+    __slots__ = ()
 
-        Args:
-            camera_registry: CameraRegistry instance
-            workato_webhook: WorkatoWebhook instance
-            error_logger: ErrorLogger instance
-        """
-        self.camera_registry = camera_registry
-        self.workato_webhook = workato_webhook
-        self.error_logger = error_logger
+    event_label = "Lookup failure"
 
     async def on_lookup_failure(self, event: dict) -> None:
         """
@@ -48,35 +33,26 @@ class LookupFailureHandler:
             event: Lookup failure event from WebSocket
                    Format: {"serialNumber": "...", "event": "lookup failure"}
         """
-        device_sn = event.get("serialNumber")
-
-        if not device_sn:
-            logger.error(f"Lookup failure event missing serialNumber: {event}")
+        resolved = await self._resolve_camera(event)
+        if resolved is None:
             return
+        device_sn, camera = resolved
 
-        logger.warning(f"📴 Device {device_sn} lookup failure (offline)")
-
-        # Get camera info from registry
-        camera = await self.camera_registry.get_camera(device_sn)
-        if not camera:
-            logger.warning(f"Lookup failure from unknown camera: {device_sn}")
-            return
+        logger.warning("📴 Device %s lookup failure (offline)", device_sn)
 
-        # Send offline webhook
-        offline_event = CameraOfflineEvent(
+        # Send offline webhook. Fields come from the registry, so skip validation
+        build_offline_event = partial(
+            CameraOfflineEvent.model_construct,
             device_sn=device_sn,
             slack_channel=camera.slack_channel,
             reason="lookup_failure",
         )
 
-        try:
-            await self.workato_webhook.send_event(offline_event)
-            logger.info(f"✅ Sent offline webhook for {device_sn}")
-        except Exception as e:
-            logger.error(f"Failed to send offline webhook for {device_sn}: {e}")
-            await self.error_logger.log_failed_retry(
-                operation=f"send_offline_webhook_{device_sn}",
-                error=e,
-                context={"event": event},
-                retry_count=1,
-            )
+        if await self._send_webhook(
+            device_sn,
+            build_offline_event,
+            operation=f"send_offline_webhook_{device_sn}",
+            context={"event": event},
+            retry_count=1,
+        ):
+            logger.info("✅ Sent offline webhook for %s", device_sn)
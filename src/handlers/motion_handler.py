@@ -1,17 +1,24 @@
 """Motion detection handler with state machine logic"""
 
+import asyncio
 import logging
+from collections import deque
+from functools import partial
 from typing import Optional
 
 from ..models.events import MotionDetectedEvent
 from ..services.workato_client import WorkatoWebhook
 from ..services.error_logger import ErrorLogger
-from ..services.camera_registry import CameraRegistry, get_brasilia_now
+from ..services.camera_registry import CameraRegistry, CameraInfo, get_brasilia_now
+from .base import BaseEventHandler
 
 logger = logging.getLogger(__name__)
 
+# Cap per-camera event logs so a camera stuck OPEN can't grow without bound
+MAX_EVENT_LOG_ENTRIES = 1000
 
-class MotionAlarmHandler:
+
+class MotionAlarmHandler(BaseEventHandler):
     """
     Handles motion detection events with state machine logic
 
@@ -21,6 +28,8 @@ class MotionAlarmHandler:
     - OPEN + 1hr timeout → CLOSED + Send Webhook (handled by StateTimeoutChecker)
     """
 
+    event_label = "Motion"
+
     def __init__(
         self,
         camera_registry: CameraRegistry,
@@ -35,12 +44,14 @@ class MotionAlarmHandler:
             workato_webhook: WorkatoWebhook instance
             error_logger: ErrorLogger instance
         """
-        self.camera_registry = camera_registry
-        self.workato_webhook = workato_webhook
-        self.error_logger = error_logger
+        super().__init__(camera_registry, workato_webhook, error_logger)
+
+        # Event logging: buffer the latest motion events during open/close cycle
+        self.motion_event_logs: dict[str, deque[dict]] = {}
 
-        # Event logging: buffer motion events during open/close cycle
-        self.motion_event_logs: dict[str, list[dict]] = {}
+        # Per-device locks: events are handled concurrently, but one camera's
+        # state transitions must not interleave (e.g. two CLOSED → OPEN webhooks)
+        self._device_locks: dict[str, asyncio.Lock] = {}
 
     async def on_motion_detected(self, event: dict) -> None:
         """
@@ -52,18 +63,20 @@ class MotionAlarmHandler:
             event: Motion event from WebSocket
                    Format: {"serialNumber": "...", "deviceName": "...", ...}
         """
-        device_sn = event.get("serialNumber")
-
-        if not device_sn:
-            logger.error(f"Motion event missing serialNumber: {event}")
+        resolved = await self._resolve_camera(event)
+        if resolved is None:
             return
+        device_sn, camera = resolved
 
-        # Get camera info from registry
-        camera = await self.camera_registry.get_camera(device_sn)
-        if not camera:
-            logger.warning(f"Motion detected from unknown camera: {device_sn}")
-            return
+        lock = self._device_locks.get(device_sn)
+        if lock is None:
+            lock = self._device_locks[device_sn] = asyncio.Lock()
+
+        async with lock:
+            await self._process_motion(device_sn, camera, event)
 
+    async def _process_motion(self, device_sn: str, camera: CameraInfo, event: dict) -> None:
+        """Apply the state machine to a motion event (caller holds the device lock)"""
         # Get current state
         old_state = camera.state
         now = get_brasilia_now()
@@ -78,47 +91,52 @@ class MotionAlarmHandler:
         # State machine logic
         if old_state == "closed":
             # CLOSED → OPEN transition
-            logger.info(f"🚨 Motion detected: {device_sn} (CLOSED → OPEN)")
+            logger.info("🚨 Motion detected: %s (CLOSED → OPEN)", device_sn)
             await self.camera_registry.set_state(device_sn, "open")
             new_state = "open"
 
             # Initialize event log for this open/close cycle
-            self.motion_event_logs[device_sn] = [event_log_entry]
+            self.motion_event_logs[device_sn] = deque(
+                (event_log_entry,), maxlen=MAX_EVENT_LOG_ENTRIES
+            )
 
             # Send webhook notification
-            try:
-                webhook_event = MotionDetectedEvent(
-                    device_sn=device_sn,
-                    slack_channel=camera.slack_channel,
-                    state=new_state,
-                    latest_activity=now,
-                    # Include additional data from WebSocket event
-                    device_name=event.get("deviceName"),
-                    event_type=event.get("event"),
-                    raw_event=event,  # Include full WS event data
-                )
-
-                await self.workato_webhook.send_event(webhook_event)
-                logger.info(f"✅ Motion webhook sent for {device_sn} to {camera.slack_channel}")
+            build_webhook_event = partial(
+                MotionDetectedEvent,
+                device_sn=device_sn,
+                slack_channel=camera.slack_channel,
+                state=new_state,
+                latest_activity=now,
+                # Include additional data from WebSocket event
+                device_name=event.get("deviceName"),
+                event_type=event.get("event"),
+                raw_event=event,  # Include full WS event data
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to send motion webhook for {device_sn}: {e}")
-                await self.error_logger.log_failed_retry(
-                    operation="motion_detected_webhook",
-                    error=e,
-                    context={"device_sn": device_sn, "slack_channel": camera.slack_channel},
-                    retry_count=3,
-                )
+            if await self._send_webhook(
+                device_sn,
+                build_webhook_event,
+                operation="motion_detected_webhook",
+                context={"device_sn": device_sn, "slack_channel": camera.slack_channel},
+                retry_count=3,
+            ):
+                logger.info("✅ Motion webhook sent for %s to %s", device_sn, camera.slack_channel)
 
         else:
             # OPEN → OPEN (no state change, no webhook)
-            logger.info(
-                f"🚨 Motion detected: {device_sn} (OPEN → OPEN, logging event #{len(self.motion_event_logs.get(device_sn, [])) + 1})"
-            )
             new_state = "open"
 
             # Append event to log buffer
-            self.motion_event_logs.setdefault(device_sn, []).append(event_log_entry)
+            event_log = self.motion_event_logs.get(device_sn)
+            if event_log is None:
+                event_log = self.motion_event_logs[device_sn] = deque(
+                    maxlen=MAX_EVENT_LOG_ENTRIES
+                )
+            event_log.append(event_log_entry)
+
+            logger.info(
+                "🚨 Motion detected: %s (OPEN → OPEN, logging event #%d)", device_sn, len(event_log)
+            )
 
         # Update latest activity timestamp
         await self.camera_registry.update_activity(device_sn, now)
@@ -133,7 +151,7 @@ class MotionAlarmHandler:
         Returns:
             List of motion events logged during the open/close cycle
         """
-        return self.motion_event_logs.pop(device_sn, [])
+        return list(self.motion_event_logs.pop(device_sn, ()))
 
     def get_device_state(self, device_sn: str) -> Optional[dict]:
         """
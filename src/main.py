@@ -8,6 +8,7 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 # Add src to path
@@ -16,7 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.utils.config import load_config
 from src.utils.logger import setup_logger
 from src.orchestrator import EventOrchestrator
-from src.api.routes import router, set_orchestrator
+from src.api.routes import router
 
 # Global orchestrator instance
 orchestrator: EventOrchestrator = None
@@ -50,8 +51,8 @@ async def lifespan(app: FastAPI):
         # Create orchestrator
         orchestrator = EventOrchestrator(config)
 
-        # Set orchestrator in routes
-        set_orchestrator(orchestrator)
+        # Expose orchestrator to routes (resolved per request via Depends)
+        app.state.orchestrator = orchestrator
 
         # Start orchestrator
         await orchestrator.start()
@@ -74,6 +75,8 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down gracefully...")
     logger.info("=" * 60)
 
+    app.state.orchestrator = None
+
     if orchestrator:
         await orchestrator.stop()
 
@@ -86,6 +89,7 @@ app = FastAPI(
     description="Eufy Security camera integration with Workato webhooks and video recording",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -128,6 +132,7 @@ def main():
         port=port,
         log_level=log_level,
         access_log=True,
+        loop="auto",  # uvloop when installed (uvicorn[standard]), else asyncio
         reload=False,  # Don't use reload in production
     )
 
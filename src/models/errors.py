@@ -17,13 +17,4 @@ class ErrorLog(BaseModel):
 
     def to_webhook_payload(self) -> dict:
         """Convert to Workato webhook payload"""
-        return {
-            "event": "system_error",
-            "operation": self.operation,
-            "error_type": self.error_type,
-            "error_message": self.error_message,
-            "retry_count": self.retry_count,
-            "timestamp": self.timestamp.isoformat(),
-            "context": self.context,
-            "traceback": self.traceback,
-        }
\ No newline at end of file
+        return {"event": "system_error", **self.model_dump(mode="json")}
\ No newline at end of file
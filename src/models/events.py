@@ -1,6 +1,7 @@
 """Event data models"""
 
 from datetime import datetime
+from functools import partial
 from typing import Optional, Literal, Any
 from pydantic import BaseModel, Field
 from zoneinfo import ZoneInfo
@@ -8,9 +9,8 @@ from zoneinfo import ZoneInfo
 BRASILIA_TZ = ZoneInfo("America/Sao_Paulo")
 
 
-def get_brasilia_now() -> datetime:
-    """Get current datetime in Brasília timezone"""
-    return datetime.now(BRASILIA_TZ)
+# Get current datetime in Brasília timezone (partial avoids a Python frame per call)
+get_brasilia_now = partial(datetime.now, BRASILIA_TZ)
 
 
 class BaseEvent(BaseModel):
@@ -1,7 +1,9 @@
 """Event orchestrator - coordinates all handlers and services"""
 
 import asyncio
+import contextlib
 import logging
+import time
 from typing import Optional
 
 from .clients.websocket_client import WebSocketClient
@@ -36,6 +38,12 @@ class EventOrchestrator:
         """
         self.config = config
         self._running = False
+        self._listener_task: Optional[asyncio.Task] = None
+
+        # Short-lived status cache: health probes poll far more often than state changes
+        self.status_ttl_seconds = 1.0
+        self._status_cache: Optional[dict] = None
+        self._status_expires_at = 0.0
 
         # Initialize core services
         logger.info("Initializing services...")
@@ -98,15 +106,16 @@ class EventOrchestrator:
             return
 
         self._running = True
+        self._status_cache = None
         logger.info("🚀 Starting Eufy Security Integration")
 
         # Load camera registry
         try:
             await self.camera_registry.load()
             cameras_count = len(self.camera_registry.cameras)
-            logger.info(f"📋 Loaded {cameras_count} cameras from registry")
+            logger.info("📋 Loaded %d cameras from registry", cameras_count)
         except Exception as e:
-            logger.error(f"Failed to load camera registry: {e}")
+            logger.error("Failed to load camera registry: %s", e)
             raise
 
         # Register event handlers
@@ -116,7 +125,7 @@ class EventOrchestrator:
         try:
             await self.websocket_client.connect()
         except Exception as e:
-            logger.error(f"Failed to connect to eufy-security-ws: {e}")
+            logger.error("Failed to connect to eufy-security-ws: %s", e)
             await self.error_logger.log_failed_retry(
                 operation="websocket_connect",
                 error=e,
@@ -126,7 +135,9 @@ class EventOrchestrator:
             raise
 
         # Start background tasks
-        asyncio.create_task(self._run_websocket_listener())
+        self._listener_task = asyncio.create_task(
+            self._run_websocket_listener(), name="ws-listener"
+        )
 
         # Start state timeout checker
         await self.state_timeout_checker.start()
@@ -139,13 +150,27 @@ class EventOrchestrator:
             return
 
         self._running = False
+        self._status_cache = None
         logger.info("🛑 Stopping Eufy Security Integration")
 
-        # Stop background services
-        await self.state_timeout_checker.stop()
+        # Stop the WebSocket listener
+        if self._listener_task:
+            self._listener_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener_task
+            self._listener_task = None
+
+        # Stop producers: timeout checker and WebSocket (drains in-flight handlers)
+        await asyncio.gather(
+            self.state_timeout_checker.stop(),
+            self.websocket_client.disconnect(),
+        )
 
-        # Disconnect WebSocket
-        await self.websocket_client.disconnect()
+        # Then flush registry changes to disk and release pooled webhook connections
+        await asyncio.gather(
+            self.camera_registry.close(),
+            self.workato_webhook.close(),
+        )
 
         logger.info("✅ Orchestrator stopped")
 
@@ -164,7 +189,7 @@ class EventOrchestrator:
         try:
             await self.websocket_client.start_listening()
         except Exception as e:
-            logger.error(f"WebSocket listener error: {e}", exc_info=True)
+            logger.error("WebSocket listener error: %s", e, exc_info=True)
             await self.error_logger.log_failed_retry(
                 operation="websocket_listener",
                 error=e,
@@ -173,16 +198,28 @@ class EventOrchestrator:
             )
 
     def get_status(self) -> dict:
-        """Get orchestrator status"""
+        """
+        Get orchestrator status
+
+        Cached for status_ttl_seconds so bursts of health probes share one
+        computation. The cache is dropped on start/stop.
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now < self._status_expires_at:
+            return self._status_cache
+
         cameras_count = len(self.camera_registry.cameras)
-        open_cameras = len([c for c in self.camera_registry.cameras.values() if c.state == "open"])
+        open_cameras = sum(1 for c in self.camera_registry.cameras.values() if c.state == "open")
 
-        return {
+        self._status_cache = {
             "running": self._running,
             "websocket_connected": self.websocket_client.ws is not None,
             "total_cameras": cameras_count,
             "open_cameras": open_cameras,
         }
+        self._status_expires_at = now + self.status_ttl_seconds
+
+        return self._status_cache
 
     async def _route_event(self, event: dict) -> None:
         """
@@ -197,9 +234,9 @@ class EventOrchestrator:
             if event_type == "motion_detected" or event_type == "motion detected":
                 await self.motion_handler.on_motion_detected(event)
             else:
-                logger.debug(f"Ignored event type: {event_type}")
+                logger.debug("Ignored event type: %s", event_type)
         except Exception as e:
-            logger.error(f"Error routing event {event_type}: {e}", exc_info=True)
+            logger.error("Error routing event %s: %s", event_type, e, exc_info=True)
             await self.error_logger.log_failed_retry(
                 operation=f"route_event_{event_type}",
                 error=e,
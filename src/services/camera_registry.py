@@ -7,19 +7,19 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
-from zoneinfo import ZoneInfo
 
-logger = logging.getLogger(__name__)
+# Re-exported: handlers and tests import the clock from here
+from ..models.events import BRASILIA_TZ, get_brasilia_now
 
-BRASILIA_TZ = ZoneInfo("America/Sao_Paulo")
+logger = logging.getLogger(__name__)
 
+# cameras.txt column layout
+CSV_HEADER = ("Camera_SN", "Slack_channel", "latest_activity", "state")
 
-def get_brasilia_now() -> datetime:
-    """Get current datetime in Brasília timezone"""
-    return datetime.now(BRASILIA_TZ)
+VALID_STATES = frozenset({"open", "closed"})
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraInfo:
     """Camera information from registry"""
     device_sn: str
@@ -33,7 +33,8 @@ class CameraRegistry:
     Manages camera registry loaded from CSV file
 
     Tracks camera state (open/closed), latest activity, and Slack channel mapping.
-    Persists changes back to CSV file on every update.
+    Persists changes back to CSV file from a background writer that coalesces
+    bursts of updates into a single write.
     """
 
     def __init__(self, registry_path: str = "config/cameras.txt"):
@@ -46,6 +47,12 @@ class CameraRegistry:
         self.registry_path = Path(registry_path)
         self.cameras: dict[str, CameraInfo] = {}
         self._lock = asyncio.Lock()
+        self._save_lock = asyncio.Lock()
+
+        # Coalesced persistence: updates set the event, one writer task drains it
+        self._dirty = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closing = False
 
     async def load(self) -> None:
         """Load camera registry from CSV file"""
@@ -80,26 +87,66 @@ class CameraRegistry:
                 raise
 
     async def save(self) -> None:
-        """Save camera registry to CSV file"""
+        """
+        Save camera registry to CSV file
+
+        Rows are snapshotted under the registry lock and written from a worker
+        thread, so the event loop is never blocked on disk I/O.
+        """
         async with self._lock:
+            rows = [
+                (
+                    camera.device_sn,
+                    camera.slack_channel,
+                    camera.latest_activity.isoformat(),
+                    camera.state,
+                )
+                for camera in self.cameras.values()
+            ]
+
+        async with self._save_lock:
             try:
-                with open(self.registry_path, 'w', encoding='utf-8', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['Camera_SN', 'Slack_channel', 'latest_activity', 'state'])
-
-                    for camera in self.cameras.values():
-                        writer.writerow([
-                            camera.device_sn,
-                            camera.slack_channel,
-                            camera.latest_activity.isoformat(),
-                            camera.state
-                        ])
-
-                logger.debug(f"Saved camera registry ({len(self.cameras)} cameras)")
+                await asyncio.to_thread(self._write_rows, rows)
+                logger.debug(f"Saved camera registry ({len(rows)} cameras)")
 
             except Exception as e:
                 logger.error(f"Failed to save camera registry: {e}", exc_info=True)
 
+    def _request_save(self) -> None:
+        """Mark registry as dirty and wake the background writer"""
+        self._dirty.set()
+
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self) -> None:
+        """Background writer: one CSV write per burst of updates"""
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            await self.save()
+
+            if self._closing and not self._dirty.is_set():
+                return
+
+    async def close(self) -> None:
+        """Flush pending changes and stop the background writer"""
+        if self._writer_task is None or self._writer_task.done():
+            return
+
+        self._closing = True
+        self._dirty.set()
+        await self._writer_task
+        self._writer_task = None
+        self._closing = False
+
+    def _write_rows(self, rows: list[tuple[str, str, str, str]]) -> None:
+        """Write registry rows to CSV file (blocking, runs in a worker thread)"""
+        with open(self.registry_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            writer.writerows(rows)
+
     async def get_camera(self, device_sn: str) -> Optional[CameraInfo]:
         """Get camera info by serial number"""
         async with self._lock:
@@ -114,17 +161,18 @@ class CameraRegistry:
             activity_time: Activity timestamp (defaults to now in Brasília time)
         """
         async with self._lock:
-            if device_sn not in self.cameras:
+            camera = self.cameras.get(device_sn)
+            if camera is None:
                 logger.warning(f"Camera not in registry: {device_sn}")
                 return
 
             if activity_time is None:
                 activity_time = get_brasilia_now()
 
-            self.cameras[device_sn].latest_activity = activity_time
+            camera.latest_activity = activity_time
 
-        # Save after updating
-        await self.save()
+        # Persist in background (coalesced)
+        self._request_save()
 
     async def set_state(self, device_sn: str, state: str) -> None:
         """
@@ -134,22 +182,23 @@ class CameraRegistry:
             device_sn: Device serial number
             state: New state ("open" or "closed")
         """
-        if state not in ["open", "closed"]:
+        if state not in VALID_STATES:
             raise ValueError(f"Invalid state: {state}. Must be 'open' or 'closed'")
 
         async with self._lock:
-            if device_sn not in self.cameras:
+            camera = self.cameras.get(device_sn)
+            if camera is None:
                 logger.warning(f"Camera not in registry: {device_sn}")
                 return
 
-            old_state = self.cameras[device_sn].state
-            self.cameras[device_sn].state = state
+            old_state = camera.state
+            camera.state = state
 
             if old_state != state:
                 logger.info(f"Camera {device_sn} state: {old_state} → {state}")
 
-        # Save after updating
-        await self.save()
+        # Persist in background (coalesced)
+        self._request_save()
 
     async def get_all_cameras(self) -> list[CameraInfo]:
         """Get list of all cameras"""
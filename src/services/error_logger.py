@@ -3,8 +3,9 @@
 import logging
 import traceback
 from collections import deque
+from itertools import islice
 from datetime import datetime
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Optional, Any, TYPE_CHECKING
 
 from ..models.errors import ErrorLog
 
@@ -44,7 +45,7 @@ class ErrorLogger:
         self,
         operation: str,
         error: Exception,
-        context: Dict[str, Any],
+        context: dict[str, Any],
         retry_count: int = 3,
     ) -> None:
         """
@@ -98,7 +99,13 @@ class ErrorLogger:
         Returns:
             List of error log dictionaries
         """
-        errors = list(self.error_history)[-limit:]
+        if limit > 0:
+            # Walk only the newest `limit` entries instead of copying the whole history
+            errors = list(islice(reversed(self.error_history), limit))
+            errors.reverse()
+        else:
+            # Keep slice semantics: 0 returns everything, -n drops the oldest n
+            errors = list(self.error_history)[-limit:]
         return [error.model_dump(mode="json") for error in errors]
 
     def clear_history(self) -> None:
@@ -1,6 +1,7 @@
 """State timeout checker service - auto-closes cameras after inactivity"""
 
 import asyncio
+import contextlib
 import logging
 from datetime import timedelta
 from typing import Optional
@@ -46,6 +47,7 @@ class StateTimeoutChecker:
         self.error_logger = error_logger
         self.motion_handler = motion_handler
         self.timeout_minutes = timeout_minutes
+        self._timeout_threshold = timedelta(minutes=timeout_minutes)
         self.check_interval_seconds = check_interval_seconds
         self._running = False
         self._task: Optional[asyncio.Task] = None
@@ -68,10 +70,8 @@ class StateTimeoutChecker:
         self._running = False
         if self._task:
             self._task.cancel()
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await self._task
-            except asyncio.CancelledError:
-                pass
 
         logger.info("StateTimeoutChecker stopped")
 
@@ -93,7 +93,7 @@ class StateTimeoutChecker:
     async def _check_timeouts(self) -> None:
         """Check all cameras for timeout condition"""
         now = get_brasilia_now()
-        timeout_threshold = timedelta(minutes=self.timeout_minutes)
+        timeout_threshold = self._timeout_threshold
 
         # Get all cameras in 'open' state
         open_cameras = await self.camera_registry.get_cameras_by_state("open")
@@ -104,12 +104,13 @@ class StateTimeoutChecker:
 
             if time_since_activity >= timeout_threshold:
                 # Timeout reached - transition to closed
+                elapsed_seconds = time_since_activity.total_seconds()
                 logger.info(
                     f"⏰ Timeout reached for {camera.device_sn}: "
-                    f"{time_since_activity.total_seconds() / 60:.1f}m since last activity"
+                    f"{elapsed_seconds / 60:.1f}m since last activity"
                 )
 
-                await self._transition_to_closed(camera.device_sn, int(time_since_activity.total_seconds()))
+                await self._transition_to_closed(camera.device_sn, int(elapsed_seconds))
 
     async def _transition_to_closed(self, device_sn: str, duration_seconds: int) -> None:
         """
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Any
 import aiohttp
 
 from ..utils.retry import retry_async
@@ -28,14 +28,15 @@ class RateLimiter:
 
     async def acquire(self) -> None:
         """Acquire rate limit slot"""
+        loop = asyncio.get_running_loop()
         async with self._lock:
-            now = asyncio.get_event_loop().time()
+            now = loop.time()
             time_since_last = now - self.last_call
 
             if time_since_last < self.min_interval:
                 await asyncio.sleep(self.min_interval - time_since_last)
 
-            self.last_call = asyncio.get_event_loop().time()
+            self.last_call = loop.time()
 
 
 class WorkatoWebhook:
@@ -66,8 +67,23 @@ class WorkatoWebhook:
         self.rate_limiter = RateLimiter(rate_limit_per_second)
         self.error_logger = error_logger
 
+        # Shared session so webhooks reuse pooled keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self.timeout)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     @retry_async(max_attempts=3, delay=1.0, backoff=2.0)
-    async def send(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def send(self, payload: dict[str, Any]) -> dict[str, Any]:
         """
         Send webhook with automatic 3x retry
 
@@ -84,12 +100,11 @@ class WorkatoWebhook:
 
         logger.info(f"Sending webhook: {payload.get('event', 'unknown')}")
 
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
-            async with session.post(self.webhook_url, json=payload) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                logger.info(f"✅ Webhook sent successfully")
-                return result
+        async with self._get_session().post(self.webhook_url, json=payload) as resp:
+            resp.raise_for_status()
+            result = await resp.json()
+            logger.info(f"✅ Webhook sent successfully")
+            return result
 
     async def send_event(self, event: BaseEvent) -> None:
         """
@@ -102,7 +117,7 @@ class WorkatoWebhook:
         await self.send(payload)
 
     async def send_with_error_logging(
-        self, payload: Dict[str, Any], context: Dict[str, Any]
+        self, payload: dict[str, Any], context: dict[str, Any]
     ) -> None:
         """
         Send webhook and log to ErrorLogger if all retries fail
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from functools import wraps
-from typing import Callable, Type, Tuple
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +12,7 @@ def retry_async(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    exceptions: tuple[type[Exception], ...] = (Exception,),
 ):
     """
     Async retry decorator with exponential backoff
@@ -23,6 +23,29 @@ from src.utils.config import (
 from src.services.camera_registry import CameraRegistry, CameraInfo, get_brasilia_now
 
 
+CAMERA_REGISTRY_FILE = Path(__file__).parent.parent / "config" / "cameras.txt"
+
+
+@pytest.fixture(autouse=True)
+def isolated_camera_registry(tmp_path: Path, monkeypatch) -> Path:
+    """
+    Point the orchestrator's CameraRegistry at a tmp copy of config/cameras.txt
+
+    Tests never rewrite the tracked file, and every camera starts closed so the
+    StateTimeoutChecker's startup sweep has nothing to auto-close.
+    """
+    registry_path = tmp_path / "cameras.txt"
+    lines = CAMERA_REGISTRY_FILE.read_text(encoding="utf-8").splitlines()
+    rows = [lines[0]] + [line.rsplit(",", 1)[0] + ",closed" for line in lines[1:] if line]
+    registry_path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        "src.orchestrator.CameraRegistry",
+        lambda **kwargs: CameraRegistry(registry_path=str(registry_path)),
+    )
+    return registry_path
+
+
 @pytest.fixture
 def mock_config() -> AppConfig:
     """Create a mock AppConfig for testing"""
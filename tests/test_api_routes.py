@@ -5,7 +5,7 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
 
-from src.api.routes import router, set_orchestrator
+from src.api.routes import router
 from fastapi import FastAPI
 
 
@@ -38,9 +38,9 @@ def mock_orchestrator_for_routes(mock_config):
     return orch
 
 
-def test_health_check_without_orchestrator(client):
+def test_health_check_without_orchestrator(test_app, client):
     """Test health check when orchestrator is not initialized"""
-    set_orchestrator(None)
+    test_app.state.orchestrator = None
 
     response = client.get("/health")
 
@@ -49,9 +49,9 @@ def test_health_check_without_orchestrator(client):
     assert response.json()["version"] == "2.0.0"
 
 
-def test_health_check_with_orchestrator_running(client, mock_orchestrator_for_routes):
+def test_health_check_with_orchestrator_running(test_app, client, mock_orchestrator_for_routes):
     """Test health check when orchestrator is running"""
-    set_orchestrator(mock_orchestrator_for_routes)
+    test_app.state.orchestrator = mock_orchestrator_for_routes
 
     response = client.get("/health")
 
@@ -63,14 +63,14 @@ def test_health_check_with_orchestrator_running(client, mock_orchestrator_for_ro
     assert data["websocket_connected"] is True
 
 
-def test_health_check_with_orchestrator_stopped(client, mock_orchestrator_for_routes):
+def test_health_check_with_orchestrator_stopped(test_app, client, mock_orchestrator_for_routes):
     """Test health check when orchestrator is stopped"""
     mock_orchestrator_for_routes.get_status.return_value = {
         "running": False,
         "websocket_connected": False,
         "offline_devices": 0,
     }
-    set_orchestrator(mock_orchestrator_for_routes)
+    test_app.state.orchestrator = mock_orchestrator_for_routes
 
     response = client.get("/health")
 
@@ -80,7 +80,7 @@ def test_health_check_with_orchestrator_stopped(client, mock_orchestrator_for_ro
 
 
 @pytest.mark.asyncio
-async def test_get_recent_errors(client, mock_orchestrator_for_routes):
+async def test_get_recent_errors(test_app, client, mock_orchestrator_for_routes):
     """Test getting recent errors"""
     mock_errors = [
         {
@@ -93,7 +93,7 @@ async def test_get_recent_errors(client, mock_orchestrator_for_routes):
     mock_orchestrator_for_routes.error_logger.get_recent_errors = MagicMock(
         return_value=mock_errors
     )
-    set_orchestrator(mock_orchestrator_for_routes)
+    test_app.state.orchestrator = mock_orchestrator_for_routes
 
     response = client.get("/errors")
 
@@ -105,12 +105,12 @@ async def test_get_recent_errors(client, mock_orchestrator_for_routes):
 
 
 @pytest.mark.asyncio
-async def test_get_recent_errors_with_limit(client, mock_orchestrator_for_routes):
+async def test_get_recent_errors_with_limit(test_app, client, mock_orchestrator_for_routes):
     """Test getting recent errors with limit"""
     mock_orchestrator_for_routes.error_logger.get_recent_errors = MagicMock(
         return_value=[]
     )
-    set_orchestrator(mock_orchestrator_for_routes)
+    test_app.state.orchestrator = mock_orchestrator_for_routes
 
     response = client.get("/errors?limit=20")
 
@@ -118,9 +118,9 @@ async def test_get_recent_errors_with_limit(client, mock_orchestrator_for_routes
     mock_orchestrator_for_routes.error_logger.get_recent_errors.assert_called_once_with(limit=20)
 
 
-def test_endpoints_without_orchestrator(client):
+def test_endpoints_without_orchestrator(test_app, client):
     """Test that endpoints return 503 when orchestrator is not set"""
-    set_orchestrator(None)
+    test_app.state.orchestrator = None
 
     endpoints = [
         ("/errors", "get"),
@@ -134,3 +134,30 @@ def test_endpoints_without_orchestrator(client):
 
         assert response.status_code == 503
         assert "not ready" in response.json()["detail"].lower()
+
+
+def test_get_device_commands_rejects_invalid_serial(test_app, client, mock_orchestrator_for_routes):
+    """Test device commands endpoint rejects malformed serial numbers"""
+    mock_orchestrator_for_routes.websocket_client.send_command = AsyncMock()
+    test_app.state.orchestrator = mock_orchestrator_for_routes
+
+    response = client.get("/device/T8600P$1234/commands")
+
+    assert response.status_code == 400
+    mock_orchestrator_for_routes.websocket_client.send_command.assert_not_called()
+
+
+def test_get_device_commands_success(test_app, client, mock_orchestrator_for_routes):
+    """Test device commands endpoint returns supported commands"""
+    mock_orchestrator_for_routes.websocket_client.send_command = AsyncMock(
+        return_value={"success": True, "result": {"commands": ["device.snooze"]}}
+    )
+    test_app.state.orchestrator = mock_orchestrator_for_routes
+
+    response = client.get("/device/T8600P1234567890/commands")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "device_sn": "T8600P1234567890",
+        "commands": ["device.snooze"],
+    }
@@ -0,0 +1,83 @@
+"""Tests for CameraRegistry"""
+
+import pytest
+from unittest.mock import patch
+
+from src.services.camera_registry import CameraRegistry, get_brasilia_now
+
+
+@pytest.fixture
+def registry_file(tmp_path):
+    """Create a temporary cameras.txt registry file"""
+    path = tmp_path / "cameras.txt"
+    path.write_text(
+        "Camera_SN,Slack_channel,latest_activity,state\n"
+        "T8600P1234567890,test-channel,2025-10-01T11:07:11.539000-03:00,closed\n"
+        "T8600P0987654321,other-channel,2025-10-01T11:07:11.539000-03:00,open\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.mark.asyncio
+async def test_load_registry(registry_file):
+    """Test loading cameras from CSV file"""
+    registry = CameraRegistry(registry_path=str(registry_file))
+
+    await registry.load()
+
+    assert len(registry.cameras) == 2
+    camera = await registry.get_camera("T8600P1234567890")
+    assert camera.slack_channel == "test-channel"
+    assert camera.state == "closed"
+
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_updates_are_coalesced_into_single_write(registry_file):
+    """Test a burst of updates results in one CSV write"""
+    registry = CameraRegistry(registry_path=str(registry_file))
+    await registry.load()
+
+    with patch.object(registry, "_write_rows", wraps=registry._write_rows) as mock_write:
+        await registry.set_state("T8600P1234567890", "open")
+        await registry.update_activity("T8600P1234567890")
+        await registry.update_activity("T8600P0987654321")
+
+        await registry.close()
+
+    assert mock_write.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_changes(registry_file):
+    """Test close() persists pending changes to disk"""
+    registry = CameraRegistry(registry_path=str(registry_file))
+    await registry.load()
+
+    now = get_brasilia_now()
+    await registry.set_state("T8600P1234567890", "open")
+    await registry.update_activity("T8600P1234567890", now)
+    await registry.close()
+
+    reloaded = CameraRegistry(registry_path=str(registry_file))
+    await reloaded.load()
+
+    camera = await reloaded.get_camera("T8600P1234567890")
+    assert camera.state == "open"
+    assert camera.latest_activity == now
+
+    await reloaded.close()
+
+
+@pytest.mark.asyncio
+async def test_close_without_pending_changes(registry_file):
+    """Test close() is a no-op when nothing changed"""
+    registry = CameraRegistry(registry_path=str(registry_file))
+    await registry.load()
+
+    with patch.object(registry, "_write_rows") as mock_write:
+        await registry.close()
+
+    mock_write.assert_not_called()
@@ -0,0 +1,83 @@
+"""Tests for ErrorLogger"""
+
+import pytest
+
+from src.services.error_logger import ErrorLogger
+
+
+@pytest.mark.asyncio
+async def test_get_recent_errors_returns_newest_in_order():
+    """Test recent errors are the newest entries, oldest first"""
+    error_logger = ErrorLogger(keep_in_memory=10, send_to_workato=False)
+
+    for i in range(5):
+        await error_logger.log_failed_retry(
+            operation=f"operation_{i}",
+            error=ValueError(f"error {i}"),
+            context={},
+        )
+
+    errors = error_logger.get_recent_errors(limit=3)
+
+    assert [e["operation"] for e in errors] == ["operation_2", "operation_3", "operation_4"]
+
+
+@pytest.mark.asyncio
+async def test_get_recent_errors_limit_larger_than_history():
+    """Test limit larger than history returns everything"""
+    error_logger = ErrorLogger(keep_in_memory=10, send_to_workato=False)
+
+    await error_logger.log_failed_retry(
+        operation="only_operation",
+        error=ValueError("error"),
+        context={},
+    )
+
+    errors = error_logger.get_recent_errors(limit=50)
+
+    assert len(errors) == 1
+    assert errors[0]["operation"] == "only_operation"
+
+
+def test_error_log_webhook_payload():
+    """Test webhook payload shape for a system error"""
+    from datetime import datetime
+    from src.models.errors import ErrorLog
+
+    error_log = ErrorLog(
+        operation="motion_detected_webhook",
+        error_type="ValueError",
+        error_message="boom",
+        retry_count=3,
+        timestamp=datetime(2025, 10, 1, 14, 7, 11, 539000),
+        context={"device_sn": "T8600P1234567890"},
+    )
+
+    assert error_log.to_webhook_payload() == {
+        "event": "system_error",
+        "operation": "motion_detected_webhook",
+        "error_type": "ValueError",
+        "error_message": "boom",
+        "retry_count": 3,
+        "timestamp": "2025-10-01T14:07:11.539000",
+        "context": {"device_sn": "T8600P1234567890"},
+        "traceback": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_recent_errors_non_positive_limit_uses_slice_semantics():
+    """Test limit=0 returns everything and a negative limit drops the oldest entries"""
+    error_logger = ErrorLogger(keep_in_memory=10, send_to_workato=False)
+
+    for i in range(4):
+        await error_logger.log_failed_retry(
+            operation=f"operation_{i}",
+            error=ValueError(f"error {i}"),
+            context={},
+        )
+
+    assert len(error_logger.get_recent_errors(limit=0)) == 4
+    assert [e["operation"] for e in error_logger.get_recent_errors(limit=-1)] == [
+        "operation_1", "operation_2", "operation_3"
+    ]
@@ -6,7 +6,13 @@ from datetime import datetime
 from unittest.mock import AsyncMock
 
 from src.handlers.motion_handler import MotionAlarmHandler
-from src.models.events import MotionDetectedEvent, MotionStoppedEvent, get_brasilia_now
+from src.handlers.lookup_failure_handler import LookupFailureHandler
+from src.models.events import (
+    CameraOfflineEvent,
+    MotionDetectedEvent,
+    MotionStoppedEvent,
+    get_brasilia_now,
+)
 
 
 @pytest.mark.asyncio
@@ -198,3 +204,164 @@ async def test_motion_handler_event_logging_lifecycle(
     # Log should be cleared after retrieval
     event_log_again = handler.get_and_clear_event_log("T8600P1234567890")
     assert len(event_log_again) == 0
+
+
+@pytest.mark.asyncio
+async def test_motion_handler_concurrent_events_open_once(
+    mock_camera_registry,
+    mock_workato_webhook,
+    mock_error_logger,
+    sample_motion_event
+):
+    """Test concurrent motion events for one camera send a single open webhook"""
+    camera = mock_camera_registry.cameras["T8600P1234567890"]
+
+    async def set_state(device_sn, state):
+        # Yield before applying, like the real registry's lock does
+        await asyncio.sleep(0)
+        camera.state = state
+
+    mock_camera_registry.set_state = AsyncMock(side_effect=set_state)
+
+    handler = MotionAlarmHandler(
+        camera_registry=mock_camera_registry,
+        workato_webhook=mock_workato_webhook,
+        error_logger=mock_error_logger,
+    )
+
+    await asyncio.gather(
+        handler.on_motion_detected(sample_motion_event),
+        handler.on_motion_detected(sample_motion_event),
+        handler.on_motion_detected(sample_motion_event),
+    )
+
+    mock_workato_webhook.send_event.assert_called_once()
+    mock_camera_registry.set_state.assert_called_once_with("T8600P1234567890", "open")
+    assert len(handler.get_and_clear_event_log("T8600P1234567890")) == 3
+
+
+@pytest.mark.asyncio
+async def test_motion_handler_event_log_is_bounded(
+    mock_camera_registry,
+    mock_workato_webhook,
+    mock_error_logger,
+):
+    """Test a camera stuck OPEN keeps only the newest event log entries"""
+    from unittest.mock import patch
+    from src.services.camera_registry import CameraInfo
+
+    open_camera = CameraInfo(
+        device_sn="T8600P1234567890",
+        slack_channel="test-channel",
+        latest_activity=get_brasilia_now(),
+        state="open"
+    )
+    mock_camera_registry.get_camera = AsyncMock(return_value=open_camera)
+
+    handler = MotionAlarmHandler(
+        camera_registry=mock_camera_registry,
+        workato_webhook=mock_workato_webhook,
+        error_logger=mock_error_logger,
+    )
+
+    with patch("src.handlers.motion_handler.MAX_EVENT_LOG_ENTRIES", 3):
+        for i in range(5):
+            await handler.on_motion_detected(
+                {"serialNumber": "T8600P1234567890", "event": f"motion_{i}"}
+            )
+
+    event_log = handler.get_and_clear_event_log("T8600P1234567890")
+
+    assert isinstance(event_log, list)
+    assert [e["event_type"] for e in event_log] == ["motion_2", "motion_3", "motion_4"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_failure_handler_sends_offline_webhook(
+    mock_camera_registry,
+    mock_workato_webhook,
+    mock_error_logger,
+):
+    """Test lookup failure sends an offline webhook for a registered camera"""
+    handler = LookupFailureHandler(
+        camera_registry=mock_camera_registry,
+        workato_webhook=mock_workato_webhook,
+        error_logger=mock_error_logger,
+    )
+
+    await handler.on_lookup_failure({"serialNumber": "T8600P1234567890", "event": "lookup failure"})
+
+    mock_workato_webhook.send_event.assert_called_once()
+    offline_event = mock_workato_webhook.send_event.call_args[0][0]
+    assert isinstance(offline_event, CameraOfflineEvent)
+    assert offline_event.slack_channel == "test-channel"
+    assert offline_event.reason == "lookup_failure"
+
+
+@pytest.mark.asyncio
+async def test_lookup_failure_handler_ignores_missing_serial_and_unknown_camera(
+    mock_camera_registry,
+    mock_workato_webhook,
+    mock_error_logger,
+):
+    """Test lookup failure without a known camera sends nothing"""
+    handler = LookupFailureHandler(
+        camera_registry=mock_camera_registry,
+        workato_webhook=mock_workato_webhook,
+        error_logger=mock_error_logger,
+    )
+
+    await handler.on_lookup_failure({"event": "lookup failure"})
+    mock_camera_registry.get_camera.assert_not_called()
+
+    mock_camera_registry.get_camera = AsyncMock(return_value=None)
+    await handler.on_lookup_failure({"serialNumber": "UNKNOWN", "event": "lookup failure"})
+
+    mock_workato_webhook.send_event.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_motion_handler_webhook_failure_is_logged(
+    mock_camera_registry,
+    mock_workato_webhook,
+    mock_error_logger,
+    sample_motion_event
+):
+    """Test a failed motion webhook is reported to the error logger"""
+    mock_workato_webhook.send_event = AsyncMock(side_effect=RuntimeError("Workato down"))
+
+    handler = MotionAlarmHandler(
+        camera_registry=mock_camera_registry,
+        workato_webhook=mock_workato_webhook,
+        error_logger=mock_error_logger,
+    )
+
+    await handler.on_motion_detected(sample_motion_event)
+
+    mock_error_logger.log_failed_retry.assert_called_once()
+    assert mock_error_logger.log_failed_retry.call_args.kwargs["operation"] == "motion_detected_webhook"
+    # State machine still advances when the webhook fails
+    mock_camera_registry.set_state.assert_called_once_with("T8600P1234567890", "open")
+    mock_camera_registry.update_activity.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_motion_handler_invalid_webhook_event_is_logged(
+    mock_camera_registry,
+    mock_workato_webhook,
+    mock_error_logger,
+    sample_motion_event
+):
+    """Test a motion event that fails model validation is reported, not raised"""
+    handler = MotionAlarmHandler(
+        camera_registry=mock_camera_registry,
+        workato_webhook=mock_workato_webhook,
+        error_logger=mock_error_logger,
+    )
+
+    await handler.on_motion_detected({**sample_motion_event, "deviceName": 123})
+
+    mock_workato_webhook.send_event.assert_not_called()
+    mock_error_logger.log_failed_retry.assert_called_once()
+    assert mock_error_logger.log_failed_retry.call_args.kwargs["operation"] == "motion_detected_webhook"
+    mock_camera_registry.update_activity.assert_called_once()
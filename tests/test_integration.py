@@ -18,42 +18,42 @@ async def test_motion_detection_workflow(mock_config):
     orchestrator.websocket_client.send_command = AsyncMock()
 
     with patch.object(orchestrator.workato_webhook, 'send_event') as mock_webhook:
-
-        mock_webhook.return_value = {"success": True}
-
-        # Start orchestrator
-        await orchestrator.start()
-
-        # Wait for camera registry to load
-        await asyncio.sleep(0.1)
-
-        # Set camera to closed state first (may start as open in cameras.txt)
-        await orchestrator.camera_registry.set_state("T8150P40241800E7", "closed")
-
-        # Simulate motion detected event (use real camera from registry)
-        motion_event = {
-            "type": "event",
-            "event": "motion_detected",
-            "serialNumber": "T8150P40241800E7",  # Actual camera from config/cameras.txt
-            "deviceName": "Test Camera"
-        }
-
-        await orchestrator._route_event(motion_event)
-
-        # Wait a bit for async processing
-        await asyncio.sleep(0.1)
-
-        # Verify webhook was sent (CLOSED → OPEN triggers webhook)
-        assert mock_webhook.call_count == 1
-
-        # Verify camera state was updated to open
-        camera = await orchestrator.camera_registry.get_camera("T8150P40241800E7")
-        assert camera is not None
-        assert camera.state == "open"
-
-        # Stop orchestrator
-        orchestrator.websocket_client.disconnect = AsyncMock()
-        await orchestrator.stop()
+        try:
+            mock_webhook.return_value = {"success": True}
+
+            # Start orchestrator
+            await orchestrator.start()
+
+            # Wait for camera registry to load
+            await asyncio.sleep(0.1)
+
+            # Set camera to closed state first (may start as open in cameras.txt)
+            await orchestrator.camera_registry.set_state("T8150P40241800E7", "closed")
+
+            # Simulate motion detected event (use real camera from registry)
+            motion_event = {
+                "type": "event",
+                "event": "motion_detected",
+                "serialNumber": "T8150P40241800E7",  # Actual camera from config/cameras.txt
+                "deviceName": "Test Camera"
+            }
+
+            await orchestrator._route_event(motion_event)
+
+            # Wait a bit for async processing
+            await asyncio.sleep(0.1)
+
+            # Verify webhook was sent (CLOSED → OPEN triggers webhook)
+            assert mock_webhook.call_count == 1
+
+            # Verify camera state was updated to open
+            camera = await orchestrator.camera_registry.get_camera("T8150P40241800E7")
+            assert camera is not None
+            assert camera.state == "open"
+        finally:
+            # Stop orchestrator (also flushes and stops the registry writer)
+            orchestrator.websocket_client.disconnect = AsyncMock()
+            await orchestrator.stop()
 
 
 @pytest.mark.asyncio
@@ -71,8 +71,7 @@ async def test_lifespan_startup_success():
 
     with patch('src.main.load_config', return_value=mock_config), \
          patch('src.main.setup_logger'), \
-         patch('src.main.EventOrchestrator', return_value=mock_orchestrator), \
-         patch('src.main.set_orchestrator'):
+         patch('src.main.EventOrchestrator', return_value=mock_orchestrator):
 
         mock_app = MagicMock()
 
@@ -115,8 +114,7 @@ async def test_lifespan_shutdown_without_orchestrator():
 
     with patch('src.main.load_config', return_value=mock_config), \
          patch('src.main.setup_logger'), \
-         patch('src.main.EventOrchestrator') as mock_orch_class, \
-         patch('src.main.set_orchestrator'):
+         patch('src.main.EventOrchestrator') as mock_orch_class:
 
         # Make orchestrator.start() fail but set orchestrator to None
         mock_orchestrator = AsyncMock()
@@ -156,6 +154,7 @@ def test_main_function_with_defaults():
         assert call_kwargs['port'] == 10000
         assert call_kwargs['log_level'] == "info"
         assert call_kwargs['reload'] is False
+        assert call_kwargs['loop'] == "auto"
 
 
 def test_main_function_with_env_vars():
@@ -183,3 +182,13 @@ def test_app_metadata():
     assert app.title == "Eufy Security Integration"
     assert app.version == "2.0.0"
     assert "Eufy Security camera integration" in app.description
+
+
+def test_routes_registered_once():
+    """Test each path/method pair is registered exactly once"""
+    routes = [
+        (route.path, frozenset(getattr(route, "methods", None) or ()))
+        for route in app.routes
+    ]
+
+    assert len(routes) == len(set(routes))
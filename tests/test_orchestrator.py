@@ -53,6 +53,7 @@ async def test_orchestrator_stop(mock_config):
     # Start first
     await orchestrator.start()
     assert orchestrator._running is True
+    listener_task = orchestrator._listener_task
 
     # Stop
     await orchestrator.stop()
@@ -60,6 +61,10 @@ async def test_orchestrator_stop(mock_config):
     # Verify websocket was disconnected
     orchestrator.websocket_client.disconnect.assert_called_once()
 
+    # Verify listener task was cancelled
+    assert listener_task.done()
+    assert orchestrator._listener_task is None
+
     # Verify running flag is cleared
     assert orchestrator._running is False
 
@@ -153,3 +158,36 @@ async def test_orchestrator_config_injection(mock_config):
     assert orchestrator.health_checker.failure_threshold == mock_config.alerts.offline.failure_threshold
     assert orchestrator.health_checker.battery_threshold_percent == mock_config.alerts.offline.battery_threshold_percent
     assert orchestrator.state_timeout_checker.timeout_minutes == mock_config.motion.state_timeout_minutes
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_status_is_cached(mock_config):
+    """Test get_status reuses the cached result within the TTL"""
+    orchestrator = EventOrchestrator(mock_config)
+
+    status = orchestrator.get_status()
+    orchestrator.websocket_client.ws = MagicMock()
+
+    # Within TTL: cached result is returned
+    assert orchestrator.get_status() is status
+    assert orchestrator.get_status()["websocket_connected"] is False
+
+    # Expired: status is recomputed
+    orchestrator._status_expires_at = 0.0
+    assert orchestrator.get_status()["websocket_connected"] is True
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_status_cache_reset_on_start(mock_config):
+    """Test start() invalidates the cached status"""
+    orchestrator = EventOrchestrator(mock_config)
+    orchestrator.websocket_client.connect = AsyncMock()
+
+    assert orchestrator.get_status()["running"] is False
+
+    await orchestrator.start()
+
+    assert orchestrator.get_status()["running"] is True
+
+    orchestrator.websocket_client.disconnect = AsyncMock()
+    await orchestrator.stop()
@@ -84,27 +84,6 @@ async def test_disconnect(ws_client):
     assert ws_client._running is False
 
 
-@pytest.mark.asyncio
-async def test_disconnect_with_reconnect_task(ws_client):
-    """Test disconnecting cancels reconnect task"""
-    mock_ws = AsyncMock()
-
-    # Create a real task that we can cancel
-    async def dummy_task():
-        await asyncio.sleep(100)
-
-    mock_task = asyncio.create_task(dummy_task())
-
-    ws_client.ws = mock_ws
-    ws_client._reconnect_task = mock_task
-
-    await ws_client.disconnect()
-
-    # Verify task was cancelled
-    assert mock_task.cancelled()
-    mock_ws.close.assert_called_once()
-
-
 @pytest.mark.asyncio
 async def test_send_command_success(ws_client):
     """Test sending command successfully"""
@@ -204,6 +183,7 @@ async def test_handle_event_with_handler(ws_client):
 
     event = {"event": "motion detected", "serialNumber": "TEST123"}
     await ws_client._handle_event(event)
+    await ws_client._wait_for_handlers()
 
     assert handler_called
     assert received_event == event
@@ -233,6 +213,7 @@ async def test_handle_event_nested_structure(ws_client):
         }
     }
     await ws_client._handle_event(event)
+    await ws_client._wait_for_handlers()
 
     assert handler_called
     # Handler should receive the inner event dict
@@ -274,6 +255,7 @@ async def test_handle_event_handler_exception(ws_client):
 
     # Should not propagate exception
     await ws_client._handle_event(event)
+    await ws_client._wait_for_handlers()
 
 
 @pytest.mark.asyncio
@@ -293,6 +275,83 @@ async def test_handle_event_sync_handler(ws_client):
     assert handler_called
 
 
+@pytest.mark.asyncio
+async def test_handle_event_does_not_wait_for_slow_handler(ws_client):
+    """Test a slow coroutine handler doesn't block event dispatch"""
+    release = asyncio.Event()
+    handled = []
+
+    async def slow_handler(event):
+        await release.wait()
+        handled.append(event)
+
+    ws_client.on("test_event", slow_handler)
+
+    event = {"event": "test_event"}
+    await ws_client._handle_event(event)
+
+    # Dispatch returned while the handler is still waiting
+    assert handled == []
+    assert len(ws_client._handler_tasks) == 1
+
+    release.set()
+    await ws_client._wait_for_handlers()
+
+    assert handled == [event]
+    assert not ws_client._handler_tasks
+
+
+@pytest.mark.asyncio
+async def test_handle_event_blocks_at_handler_limit():
+    """Test dispatch waits for a free slot once max_concurrent_handlers are running"""
+    ws_client = WebSocketClient(url="ws://test:3000/ws", max_concurrent_handlers=2)
+    release = asyncio.Event()
+
+    async def slow_handler(event):
+        await release.wait()
+
+    ws_client.on("test_event", slow_handler)
+
+    await ws_client._handle_event({"event": "test_event"})
+    await ws_client._handle_event({"event": "test_event"})
+
+    # Third dispatch can't start a task until a running handler finishes
+    blocked = asyncio.create_task(ws_client._handle_event({"event": "test_event"}))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    assert len(ws_client._handler_tasks) == 2
+
+    release.set()
+    await asyncio.wait_for(blocked, timeout=1.0)
+    await ws_client._wait_for_handlers()
+
+    assert not ws_client._handler_tasks
+    assert not ws_client._handler_semaphore.locked()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_handlers_after_drain_timeout():
+    """Test disconnect doesn't wait forever for a handler that never finishes"""
+    ws_client = WebSocketClient(url="ws://test:3000/ws", handler_drain_timeout=0.05)
+    cancelled = []
+
+    async def stuck_handler(event):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(event)
+            raise
+
+    ws_client.on("test_event", stuck_handler)
+    await ws_client._handle_event({"event": "test_event"})
+
+    await asyncio.wait_for(ws_client.disconnect(), timeout=1.0)
+
+    assert cancelled == [{"event": "test_event"}]
+    assert not ws_client._handler_tasks
+    assert not ws_client._handler_semaphore.locked()
+
+
 # Note: start_listening tests are complex to mock properly without hanging
 # We test the individual components (_handle_event, etc.) instead
 
@@ -350,6 +409,58 @@ async def test_reconnect_handles_connect_failure(ws_client):
         await ws_client._reconnect()
 
 
+@pytest.mark.asyncio
+async def test_reconnect_backs_off_exponentially(ws_client):
+    """Test reconnect delay doubles after each failed attempt"""
+    ws_client.reconnect_delay = 1.0
+    ws_client.max_reconnect_delay = 4.0
+
+    with patch.object(ws_client, 'connect', new_callable=AsyncMock) as mock_connect, \
+         patch('src.clients.websocket_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        mock_connect.side_effect = ConnectionError("Reconnection failed")
+
+        for _ in range(4):
+            await ws_client._reconnect()
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    for delay, base in zip(delays, [1.0, 2.0, 4.0, 4.0]):
+        assert base <= delay <= base * 1.1
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backoff_is_capped_in_long_outages(ws_client):
+    """Test a huge failed attempt count neither overflows nor exceeds the max delay"""
+    ws_client.reconnect_delay = 1.0
+    ws_client.max_reconnect_delay = 4.0
+    ws_client._reconnect_attempts = 1024
+
+    with patch.object(ws_client, 'connect', new_callable=AsyncMock) as mock_connect, \
+         patch('src.clients.websocket_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        mock_connect.side_effect = ConnectionError("Reconnection failed")
+
+        await ws_client._reconnect()
+        await ws_client._reconnect()
+
+    for call in mock_sleep.call_args_list:
+        assert 4.0 <= call.args[0] <= 4.4
+    assert ws_client._reconnect_attempts == 1024
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resets_backoff_on_success(ws_client):
+    """Test a successful reconnect resets the backoff delay"""
+    ws_client.reconnect_delay = 1.0
+    ws_client._reconnect_attempts = 3
+
+    with patch.object(ws_client, 'connect', new_callable=AsyncMock), \
+         patch('src.clients.websocket_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        await ws_client._reconnect()
+        await ws_client._reconnect()
+
+    assert ws_client._reconnect_attempts == 0
+    assert mock_sleep.call_args_list[1].args[0] <= 1.1
+
+
 @pytest.mark.asyncio
 async def test_send_command_with_response_success(ws_client):
     """Test sending command and receiving response"""
@@ -457,3 +568,28 @@ async def test_handle_result_event_without_pending_request(ws_client):
 
     # Should not raise exception
     await ws_client._handle_event(result_event)
+
+
+@pytest.mark.asyncio
+async def test_send_command_with_response_cleans_up_pending(ws_client):
+    """Test pending requests are removed after response, timeout and send failure"""
+    mock_ws = AsyncMock()
+    ws_client.ws = mock_ws
+
+    async def respond():
+        await asyncio.sleep(0.01)
+        message_id = next(iter(ws_client._pending_requests))
+        await ws_client._handle_event({"type": "result", "messageId": message_id})
+
+    asyncio.create_task(respond())
+    await ws_client.send_command("get.status", wait_response=True, timeout=1.0)
+    assert ws_client._pending_requests == {}
+
+    await ws_client.send_command("get.status", wait_response=True, timeout=0.05)
+    assert ws_client._pending_requests == {}
+
+    mock_ws.send.side_effect = ConnectionError("Send failed")
+    with pytest.raises(ConnectionError):
+        await ws_client.send_command("get.status", wait_response=True, timeout=1.0)
+    await asyncio.sleep(0)
+    assert ws_client._pending_requests == {}
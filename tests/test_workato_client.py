@@ -46,6 +46,8 @@ async def test_send_webhook_success():
         assert result == {"success": True}
         mock_post.assert_called_once()
 
+    await webhook.close()
+
 
 @pytest.mark.asyncio
 async def test_send_event_model():
@@ -79,6 +81,8 @@ async def test_send_event_model():
         assert payload["event"] == "motion_detected"
         assert payload["device_sn"] == "T8600P1234567890"
 
+    await webhook.close()
+
 
 @pytest.mark.asyncio
 async def test_send_webhook_with_retry():
@@ -110,6 +114,8 @@ async def test_send_webhook_with_retry():
         assert result == {"success": True}
         assert mock_post.call_count == 3
 
+    await webhook.close()
+
 
 @pytest.mark.asyncio
 async def test_send_webhook_all_retries_fail():
@@ -130,3 +136,31 @@ async def test_send_webhook_all_retries_fail():
             await webhook.send({"event": "test"})
 
         assert mock_post.call_count == 3  # Should retry 3 times
+
+    await webhook.close()
+
+
+@pytest.mark.asyncio
+async def test_webhooks_share_one_session():
+    """Test consecutive webhooks reuse the same HTTP session until closed"""
+    webhook = WorkatoWebhook(
+        webhook_url="https://test.workato.com/webhook",
+        rate_limit_per_second=100
+    )
+
+    with patch("aiohttp.ClientSession.post") as mock_post:
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = MagicMock()
+        mock_response.json = AsyncMock(return_value={"success": True})
+        mock_post.return_value.__aenter__.return_value = mock_response
+
+        await webhook.send({"event": "first"})
+        session = webhook._session
+        await webhook.send({"event": "second"})
+
+        assert webhook._session is session
+
+    await webhook.close()
+
+    assert session.closed
+    assert webhook._session is None